@@ -17,6 +17,8 @@ if not tools_pyradox_src.is_dir():
 
 sys.path.insert(0, str(tools_pyradox_src))
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ir_to_eu5.extract_data import (
     extract_10_countries,
     extract_coa_data,
@@ -24,10 +26,11 @@ from ir_to_eu5.extract_data import (
     extract_culture_data,
     extract_eu5_map_data,
     extract_religion_data,
+    read_localisation_file,
     write_json,
 )
 from ir_to_eu5.map_data import parse_definitions, port_map_data
-from ir_to_eu5.paths import mod_root
+from ir_to_eu5.paths import ir_localisation, mod_root
 from ir_to_eu5.port_gfx import port_coa_gfx
 from ir_to_eu5.write_data import (
     write_10_countries,
@@ -41,13 +44,28 @@ from ir_to_eu5.write_data import (
 )
 
 if __name__ == "__main__":
-    culture_data = extract_culture_data()
-    religion_data = extract_religion_data()
-    country_data, country_overrides = extract_country_data()
-    coa_data = extract_coa_data()
-    named_locations = {t[0]: t[1] for t in parse_definitions()}
-    ten_countries_data = extract_10_countries()
-    eu5_map_data = extract_eu5_map_data()
+    # Warm the shared localisation cache before fanning out so the parallel
+    # extractors all hit it instead of parsing the directory in parallel.
+    read_localisation_file(ir_localisation)
+
+    # The extraction passes are independent of each other; run them
+    # concurrently and only block where their results are consumed.
+    with ThreadPoolExecutor() as executor:
+        culture_future = executor.submit(extract_culture_data)
+        religion_future = executor.submit(extract_religion_data)
+        country_future = executor.submit(extract_country_data)
+        coa_future = executor.submit(extract_coa_data)
+        definitions_future = executor.submit(parse_definitions)
+        ten_countries_future = executor.submit(extract_10_countries)
+        eu5_map_future = executor.submit(extract_eu5_map_data)
+
+        culture_data = culture_future.result()
+        religion_data = religion_future.result()
+        country_data, country_overrides = country_future.result()
+        coa_data = coa_future.result()
+        named_locations = {t[0]: t[1] for t in definitions_future.result()}
+        ten_countries_data = ten_countries_future.result()
+        eu5_map_data = eu5_map_future.result()
 
     write_json(culture_data, mod_root / "cultures.json")
     write_json(religion_data, mod_root / "religions.json")
@@ -1,6 +1,9 @@
 import json
+import os
 import re
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -18,9 +21,25 @@ pyradox.Color = _pydt.Color
 # ---------- Helper ----------
 
 
+UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _read_text(file_path: Path) -> str:
+    """Read a file as UTF-8 text, dropping a leading BOM if present.
+
+    read_text(encoding="utf-8-sig") pushes every byte through the sig
+    codec's incremental decoder just to handle the first three; slicing
+    the BOM off the raw bytes and decoding plain UTF-8 once is cheaper.
+    """
+    data = file_path.read_bytes()
+    if data.startswith(UTF8_BOM):
+        data = data[len(UTF8_BOM) :]
+    return data.decode("utf-8")
+
+
 def parse_tree(file_path: Path):
     """Parse a file into a pyradox.Tree."""
-    text = file_path.read_text(encoding="utf-8-sig")
+    text = _read_text(file_path)
     tree = parse_txt(text, filename=str(file_path))
     return tree
 
@@ -45,38 +64,55 @@ def write_json(data: Any, out_path: Path) -> Path:
     """
     serializable = _make_serializable(data)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(serializable, f, ensure_ascii=False, indent=2)
+    # Serialize to one string and write the encoded bytes in a single call;
+    # json.dump on a text handle trickles many small writes through the
+    # encoder instead.
+    text = json.dumps(serializable, ensure_ascii=False, indent=2)
+    out_path.write_bytes(text.encode("utf-8"))
     print_written("JSON", out_path)
     return out_path
 
 
 # ---------- Localisation ----------
 
+# Compiled once at import time; read_localisation_file is called for every
+# extraction pass, so recompiling per call is wasted work. Anchored per line
+# so one finditer sweep covers a whole file.
+LOC_ENTRY_PATTERN = re.compile(
+    r'^[ \t]*([A-Za-z0-9_@:\-\.]+):[ \t]*\d+[ \t]+"(.*)"', re.MULTILINE
+)
+
+_localisation_cache: dict[Path, dict[str, str]] = {}
+
 
 def read_localisation_file(path: Path) -> dict[str, str]:
-    """Read localisation from a directory or single file."""
+    """Read localisation from a directory or single file.
+
+    Results are cached per path: several extraction passes consult the
+    same Imperator localisation directory, and nothing mutates the
+    returned mapping.
+    """
+    cached = _localisation_cache.get(path)
+    if cached is not None:
+        return cached
+
     result: dict[str, str] = {}
-    pattern = re.compile(r'^([A-Za-z0-9_@:\-\.]+):\s*\d+\s+"(.*)"')
 
     files = []
     if path.is_file():
         files = [path]
     elif path.is_dir():
-        files = sorted(p for p in path.rglob("*") if p.is_file() and p.suffix == ".yml")
-    else:
-        return result
-
-    for file in files:
-        for line in file.read_text(encoding="utf-8-sig").splitlines():
-            line = line.strip()
-            if not line or line.startswith("#") or line.endswith(":"):
-                continue
-            match = pattern.match(line)
-            if match:
-                key, value = match.groups()
-                result[key] = value
+        files = sorted(p for p in path.rglob("*.yml") if p.is_file())
+
+    # One bytes read and plain UTF-8 decode per file via _read_text. The
+    # texts are then concatenated so one finditer sweep covers the whole
+    # directory instead of restarting the matcher per file.
+    texts = [_read_text(file) for file in files]
+    for match in LOC_ENTRY_PATTERN.finditer("\n".join(texts)):
+        key, value = match.groups()
+        result[key] = value
 
+    _localisation_cache[path] = result
     return result
 
 
@@ -87,12 +123,20 @@ def extract_culture_data():
     culture_loc = read_localisation_file(ir_localisation)
     culture_blocks = []
 
-    for path in ir_cultures.iterdir():
-        if path.suffix != ".txt" or not path.is_file():
-            continue
+    with os.scandir(ir_cultures) as entries:
+        culture_files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and entry.name.endswith(".txt")
+        ]
 
-        tree = parse_tree(path)
+    # Each culture-group file parses independently; the thread pool overlaps
+    # the file reads while executor.map keeps the results in input order, so
+    # the merge below stays deterministic.
+    with ThreadPoolExecutor() as executor:
+        trees = list(executor.map(parse_tree, culture_files))
 
+    for tree in trees:
         for group_tag, group_data in tree.items():
             [(_, ethnicity)] = group_data["ethnicities"].items()
             cultures = group_data["culture"]
@@ -136,6 +180,14 @@ def extract_religion_data():
     return religion_blocks
 
 
+TAG_LOC_OVERRIDES = {
+    "DEL": "Nesio",  # Nesiotic League
+    "SEL": "Seleucids",  # Seleucid Empire
+    "BPK": "Bospora",  # Bosporan Kingdom
+    "PRY": "Antigonids",  # Antigonid Kingdom
+}
+
+
 def extract_country_data():
     default_tree = parse_tree(ir_default)
     country_tree = default_tree["country"]["countries"]
@@ -145,21 +197,18 @@ def extract_country_data():
     setup_dirs = dict(setup_tree.items())
     country_blocks = []
 
+    # Multiple tags can point at the same setup file; parse each file once.
+    setup_trees: dict[Path, Any] = {}
+
     for country_tag, country_data in country_tree.items():
         country_setup_file: Path = ir_game / setup_dirs.get(country_tag)
-        country_setup_tree = parse_tree(country_setup_file)
-
-        tag_loc_overrides = {
-            "DEL": "Nesio",  # Nesiotic League
-            "SEL": "Seleucids",  # Seleucid Empire
-            "BPK": "Bospora",  # Bosporan Kingdom
-            "PRY": "Antigonids",  # Antigonid Kingdom
-        }
+        country_setup_tree = setup_trees.get(country_setup_file)
+        if country_setup_tree is None:
+            country_setup_tree = parse_tree(country_setup_file)
+            setup_trees[country_setup_file] = country_setup_tree
 
         country_name = (
-            country_loc[country_tag]
-            if country_tag not in tag_loc_overrides
-            else tag_loc_overrides[country_tag]
+            TAG_LOC_OVERRIDES.get(country_tag) or country_loc[country_tag]
         )
         country_name_adj = country_loc[f"{country_tag}_ADJ"]
 
@@ -168,8 +217,10 @@ def extract_country_data():
                 "tag": country_tag,
                 "name": country_name,
                 "name_adj": country_name_adj,
-                "culture": f"ir_{country_data['primary_culture']}",
-                "religion": f"ir_{country_data['religion']}",
+                # Interned: a handful of cultures/religions repeat across
+                # hundreds of countries, so share one string object each.
+                "culture": sys.intern(f"ir_{country_data['primary_culture']}"),
+                "religion": sys.intern(f"ir_{country_data['religion']}"),
                 "government": country_data["government"],
                 "government_type": government_map.get(country_data["government"]),
                 "color": country_setup_tree["color"],
@@ -181,7 +232,10 @@ def extract_country_data():
     # Read EU5 countries for writing overrides
     override_blocks = defaultdict(list)
 
-    for eu5_country_file in eu5_countries.iterdir():
+    with os.scandir(eu5_countries) as entries:
+        eu5_country_files = [Path(entry.path) for entry in entries if entry.is_file()]
+
+    for eu5_country_file in eu5_country_files:
         eu5_countries_tree = parse_tree(eu5_country_file)
         for country_tag, country_data in eu5_countries_tree.items():
             override_blocks[eu5_country_file.relative_to(eu5_game)].append(
@@ -196,12 +250,16 @@ def extract_country_data():
     return country_blocks, override_blocks
 
 
+# Matches .tga texture references; applied to every string in the CoA tree
+RE_TGA_SUFFIX = re.compile(r"\.tga\b", re.IGNORECASE)
+
+
 def extract_coa_data():
     coa_tree = parse_tree(ir_prescripted_coa)
 
     def _replace_tga_with_dds(obj: Any) -> None:
         def _update_str(s: str) -> str:
-            return re.sub(r"(?i)\.tga\b", ".dds", s)
+            return RE_TGA_SUFFIX.sub(".dds", s)
 
         if isinstance(obj, dict):
             for k, v in list(obj.items()):
@@ -1,6 +1,7 @@
 import csv
 import re
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 
 import pyradox.datatype as _pydt
@@ -141,18 +142,24 @@ superregion_map = {
 
 # ---------------- Utility Functions ---------------- #
 
+RE_NAME_SEPARATORS = re.compile(r"[ \-]+")
+RE_CAMEL_BOUNDARY = re.compile(r"(?<=[^_])(?=[A-Z])")
+RE_INVALID_KEY_CHARS = re.compile(r"[^a-z0-9_]")
 
+
+@lru_cache(maxsize=None)
 def clean_name(name: str) -> str:
-    """Convert names to safe lowercase keys."""
-    name = re.sub(r"[ \-]+", "_", name)
+    """Convert names to safe lowercase keys.
+
+    Memoized: many provinces share a display name, so repeat calls are
+    served from the cache instead of re-running the substitutions.
+    """
+    name = RE_NAME_SEPARATORS.sub("_", name)
     if not name.isupper() and name:
-        new_name = name[0]
-        for c, prev in zip(name[1:], name[:-1]):
-            if c.isupper() and prev != "_":
-                new_name += "_"
-            new_name += c
-        name = new_name
-    return re.sub(r"[^a-z0-9_]", "", name.lower())
+        # Split camel-case words with a single regex pass instead of
+        # walking the string character by character.
+        name = RE_CAMEL_BOUNDARY.sub("_", name)
+    return RE_INVALID_KEY_CHARS.sub("", name.lower())
 
 
 def read_csv(file_path: Path, skip_header=True):
@@ -169,8 +176,7 @@ def write_csv(file_path: Path, data: list[dict], fieldnames: list[str]):
     with open(file_path, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=";")
         writer.writeheader()
-        for row in data:
-            writer.writerow({k: row.get(k, "") for k in fieldnames})
+        writer.writerows({k: row.get(k, "") for k in fieldnames} for row in data)
     print_written("CSV", file_path)
 
 
@@ -358,6 +364,11 @@ def hierarchy_to_blocks(data: dict) -> list[tuple[str, list]]:
     return blocks
 
 
+# default.map entry patterns, compiled once rather than per call
+RE_DEFAULT_MAP_LIST = re.compile(r"(\w+)\s*=\s*LIST\s*{\s*([\d\s]+)\s*}")
+RE_DEFAULT_MAP_RANGE = re.compile(r"(\w+)\s*=\s*RANGE\s*{\s*(\d+)\s+(\d+)\s*}")
+
+
 def build_default_map(id_to_key: dict[int, str]):
     """
     Parses default.map and returns a dictionary:
@@ -366,10 +377,6 @@ def build_default_map(id_to_key: dict[int, str]):
     default_map = ir_map_data / "default.map"
     data = {}
 
-    # Patterns
-    list_pattern = re.compile(r"(\w+)\s*=\s*LIST\s*{\s*([\d\s]+)\s*}")
-    range_pattern = re.compile(r"(\w+)\s*=\s*RANGE\s*{\s*(\d+)\s+(\d+)\s*}")
-
     with open(default_map, encoding="utf-8") as f:
         for line in f:
             line = line.strip()
@@ -377,7 +384,7 @@ def build_default_map(id_to_key: dict[int, str]):
                 continue
 
             # LIST entry
-            list_match = list_pattern.match(line)
+            list_match = RE_DEFAULT_MAP_LIST.match(line)
             if list_match:
                 category, numbers = list_match.groups()
                 category = category.lower()  # normalize to lowercase
@@ -386,7 +393,7 @@ def build_default_map(id_to_key: dict[int, str]):
                 continue
 
             # RANGE entry
-            range_match = range_pattern.match(line)
+            range_match = RE_DEFAULT_MAP_RANGE.match(line)
             if range_match:
                 category, start, end = range_match.groups()
                 category = category.lower()  # normalize to lowercase
@@ -397,6 +404,29 @@ def build_default_map(id_to_key: dict[int, str]):
     return data
 
 
+# IR default.map category -> EU5 default.map category
+CATEGORY_MAPPING = {
+    "sea_zones": "sea_zones",
+    "lakes": "lakes",
+    "impassable_terrain": "impassable_mountains",
+    "uninhabitable": "non_ownable",
+    "wasteland": "non_ownable",
+    "river_provinces": "river_provinces",
+}
+
+DEFAULT_MAP_INIT_LINES = [
+    'provinces = "locations.png"',
+    'rivers = "rivers.png"',
+    'topology = "heightmap.heightmap"',
+    'adjacencies = "adjacencies.csv"',
+    'setup = "definitions.txt"',
+    'ports = "ports.csv"',
+    'location_templates = "location_templates.txt"',
+    "equator_y = 3340",
+    "wrap_x = no",
+]
+
+
 def write_default_map(ir_default_map_data: dict):
     """
     Writes the default.map file for Imperator / EU modding, mapping and aggregating categories.
@@ -404,16 +434,6 @@ def write_default_map(ir_default_map_data: dict):
     """
     default_map = iu_map_data / "default.map"
 
-    # Category mapping
-    category_mapping = {
-        "sea_zones": "sea_zones",
-        "lakes": "lakes",
-        "impassable_terrain": "impassable_mountains",
-        "uninhabitable": "non_ownable",
-        "wasteland": "non_ownable",
-        "river_provinces": "river_provinces",
-    }
-
     # Aggregate wasteland into non_ownable if present
     if "wasteland" in ir_default_map_data:
         ir_default_map_data.setdefault("uninhabitable", set()).update(
@@ -421,35 +441,20 @@ def write_default_map(ir_default_map_data: dict):
         )
         ir_default_map_data.pop("wasteland")
 
-    init_lines = [
-        'provinces = "locations.png"',
-        'rivers = "rivers.png"',
-        'topology = "heightmap.heightmap"',
-        'adjacencies = "adjacencies.csv"',
-        'setup = "definitions.txt"',
-        'ports = "ports.csv"',
-        'location_templates = "location_templates.txt"',
-        "equator_y = 3340",
-        "wrap_x = no",
-    ]
+    # Header/init lines, then each category as a LIST block, accumulated as
+    # a line list and flushed with a single write.
+    lines = list(DEFAULT_MAP_INIT_LINES)
+    lines.append("")
+
+    for category, keys in ir_default_map_data.items():
+        mapped_category = CATEGORY_MAPPING.get(category, category)
+        lines.append(f"{mapped_category} = {{")
+        lines.extend(f"    {key}" for key in sorted(keys))
+        lines.append("}")
+        lines.append("")
 
     with default_map.open("w", encoding="utf-8") as f:
-        # Write header/init lines
-        for line in init_lines:
-            f.write(f"{line}\n")
-        f.write("\n")
-
-        # Helper: write a category as a LIST block
-        def write_category(cat_name: str, keys: set):
-            f.write(f"{cat_name} = {{\n")
-            for key in sorted(keys):
-                f.write(f"    {key}\n")
-            f.write("}\n\n")
-
-        # Write each category in the aggregated data using mapping
-        for category, keys in ir_default_map_data.items():
-            mapped_category = category_mapping.get(category, category)
-            write_category(mapped_category, keys)
+        f.write("\n".join(lines) + "\n")
     print_written("file", default_map)
 
 
@@ -461,9 +466,13 @@ def port_map_data():
     # Named locations file
     named_path = iu_map_data / "named_locations"
     named_path.mkdir(parents=True, exist_ok=True)
+    # Build the file in memory and write it once; thousands of tiny writes
+    # each pay the text-wrapper overhead.
+    named_lines = [
+        f"{key} = {r:02x}{g:02x}{b:02x}" for _, key, r, g, b, _ in named_locations
+    ]
     with open(named_path / "00_default.txt", "w", encoding="utf-8-sig") as f:
-        for _, key, r, g, b, _ in named_locations:
-            f.write(f"{key} = {r:02x}{g:02x}{b:02x}\n")
+        f.write("\n".join(named_lines) + "\n")
     print_written("file", named_path / "00_default.txt")
 
     # ---------------- Reference ID-to-Key File ---------------- #
@@ -1,73 +1,103 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+import numpy as np
 from PIL import Image
 
 from .paths import ir_coa_gfx, iu_coa_gfx, mod_root
 from .write_data import print_written
 
+# Source "magenta-ish" color and the blue it gets shifted towards
+MAGENTA_SOURCE = np.array([255, 0, 128], dtype=np.float32)
+MAGENTA_TARGET = np.array([0, 0, 128], dtype=np.float32)
+
 
 def replace_magenta_red_channel(img: Image.Image, strength: float = 0.7) -> Image.Image:
     """
     Shift pixels that are magenta-ish toward blue, keeping subtle differences.
     strength: 0.0 = no change, 1.0 = full replacement
     """
-    pixels = img.load()
-    width, height = img.size
-
-    # Source "magenta-ish" color
-    fr, fg, fb = 255, 0, 128
-    # Target color
-    tr, tg, tb = 0, 0, 128
+    arr = np.asarray(img, dtype=np.float32)
+    rgb = arr[..., :3]
 
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
+    # Blend every magenta-ish pixel in one vectorized pass instead of
+    # looping over pixels in Python.
+    diff = np.abs(rgb - MAGENTA_SOURCE).sum(axis=-1)
+    mask = diff < 100  # adjust threshold as needed
+    rgb[mask] += (MAGENTA_TARGET - rgb[mask]) * strength
 
-            # Compute difference from source
-            diff = abs(r - fr) + abs(g - fg) + abs(b - fb)
-            if diff < 100:  # adjust threshold as needed
-                # Blend channels proportionally
-                r_new = int(r + (tr - r) * strength)
-                g_new = int(g + (tg - g) * strength)
-                b_new = int(b + (tb - b) * strength)
-                pixels[x, y] = (r_new, g_new, b_new, a)
+    out = np.clip(arr, 0, 255).astype(np.uint8)
+    return Image.fromarray(out, mode="RGBA")
 
-    return img
 
-
-def convert_images(
-    input_dir: Path,
+def convert_image(
+    path: Path,
     output_dir: Path,
     size=(384, 256),
     stretch: bool = False,
     colour_shift: bool = False,
-    tolerance: int = 10,
+    strength: float = 0.7,
 ):
-    output_dir.mkdir(parents=True, exist_ok=True)
+    with Image.open(path) as img:
+        img = img.convert("RGBA")
 
-    for path in input_dir.iterdir():
-        if path.suffix.lower() not in {".dds", ".tga"}:
-            continue
+        if colour_shift:
+            img = replace_magenta_red_channel(img, strength)
 
-        with Image.open(path) as img:
-            img = img.convert("RGBA")
+        if stretch:
+            resized = img.resize(size, Image.LANCZOS)
+        else:
+            resized = Image.new("RGBA", size, (0, 0, 0, 0))
+            img.thumbnail(size, Image.LANCZOS)
 
-            if colour_shift:
-                img = replace_magenta_red_channel(img, tolerance)
+            x = (size[0] - img.width) // 2
+            y = (size[1] - img.height) // 2
+            resized.paste(img, (x, y))
 
-            if stretch:
-                resized = img.resize(size, Image.LANCZOS)
-            else:
-                resized = Image.new("RGBA", size, (0, 0, 0, 0))
-                img.thumbnail(size, Image.LANCZOS)
+        out_path = output_dir / (path.stem + ".dds")
+        resized.save(out_path, format="DDS")
+        print_written("image", out_path)
 
-                x = (size[0] - img.width) // 2
-                y = (size[1] - img.height) // 2
-                resized.paste(img, (x, y))
 
-            out_path = output_dir / (path.stem + ".dds")
-            resized.save(out_path, format="DDS")
-            print_written("image", out_path)
+def convert_images(
+    input_dir: Path,
+    output_dir: Path,
+    size=(384, 256),
+    stretch: bool = False,
+    colour_shift: bool = False,
+    strength: float = 0.7,
+):
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # scandir hands back names without an extra stat per entry, which adds
+    # up over the emblem directories' thousands of files.
+    with os.scandir(input_dir) as entries:
+        paths = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.lower().endswith((".dds", ".tga"))
+        ]
+
+    # Each image is independent and Pillow releases the GIL while
+    # decoding/encoding, so threads overlap the file I/O and codec work.
+    # Oversubscribe the cores since most of the wait is on disk.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(
+            executor.map(
+                partial(
+                    convert_image,
+                    output_dir=output_dir,
+                    size=size,
+                    stretch=stretch,
+                    colour_shift=colour_shift,
+                    strength=strength,
+                ),
+                paths,
+            )
+        )
 
 
 def port_coa_gfx():
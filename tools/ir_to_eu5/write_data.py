@@ -1,5 +1,6 @@
 import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple, Union
 
@@ -139,26 +140,32 @@ def write_blocks(
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with out_path.open(mode, encoding=encoding) as f:
-        # --- header ---
-        f.write(AUTO_GENERATED_HEADER)
-
-        for block in blocks_list:
-            if isinstance(block, tuple) and len(block) == 2:
-                tag, lines = block
-                content = make_block(tag, lines, indent_level=0, indent_str=indent_str)
-                # Collapse accidental double-empty-brace sequences (e.g. "{ {} }")
-                content = content.replace("{ {} }", "{}")
-                f.write(content)
-                f.write("\n")
-            else:
-                s = str(block)
-                s = s.replace("{ {} }", "{}")
-                f.write(s)
-                if not s.endswith("\n"):
-                    f.write("\n")
-                if out_path.suffix not in (".yml", ".yaml"):
-                    f.write("\n")
+    # Accumulate everything and flush with a single write instead of many
+    # small f.write calls through the TextIOWrapper.
+    parts: List[str] = [AUTO_GENERATED_HEADER]
+
+    for block in blocks_list:
+        if isinstance(block, tuple) and len(block) == 2:
+            tag, lines = block
+            parts.append(make_block(tag, lines, indent_level=0, indent_str=indent_str))
+            parts.append("\n")
+        else:
+            s = str(block)
+            parts.append(s)
+            if not s.endswith("\n"):
+                parts.append("\n")
+            if out_path.suffix not in (".yml", ".yaml"):
+                parts.append("\n")
+
+    # Collapse accidental double-empty-brace sequences (e.g. "{ {} }") in one
+    # pass over the joined buffer rather than once per block.
+    content = "".join(parts).replace("{ {} }", "{}")
+
+    # Encode once and write the raw bytes; a text-mode handle would re-encode
+    # incrementally through a TextIOWrapper. Also pins the files to LF
+    # newlines regardless of platform.
+    with out_path.open(mode + "b") as f:
+        f.write(content.encode(encoding))
 
     print_written("file", out_path)
     return out_path
@@ -171,22 +178,27 @@ def write_culture_group_data(culture_data: list):
 
 
 def write_culture_data(culture_data: list):
-    for culture_group in culture_data:
-        blocks = []
-
-        for culture in culture_group["cultures"]:
-            lines = [
-                f"color = {culture_group['color']}",
-                f"tags = {{ {culture_group['graphical_culture']} }}",
-                f"culture_groups = {{ {culture_group['tag']} }}",
-            ]
+    def write_group(culture_group):
+        # Every culture in a group shares the same body; format it once
+        # instead of per culture. write_blocks only reads the lines, so
+        # sharing the list between blocks is safe.
+        lines = [
+            f"color = {culture_group['color']}",
+            f"tags = {{ {culture_group['graphical_culture']} }}",
+            f"culture_groups = {{ {culture_group['tag']} }}",
+        ]
 
-            blocks.append((culture["tag"], lines))
+        blocks = [(culture["tag"], lines) for culture in culture_group["cultures"]]
 
         out_path = iu_cultures / f"{culture_group['tag']}.txt"
 
         write_blocks(out_path, blocks)
 
+    # One output file per culture group with no shared state between them,
+    # so the writes can overlap in a thread pool.
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(write_group, culture_data))
+
 
 def write_religion_group_data(religion_data: list):
     blocks = [
@@ -224,10 +236,14 @@ def write_religion_data(religion_data: list):
 def write_country_setup(country_data: list, override_data: list):
     setup_dir_dict = defaultdict(list)
 
+    # Invariant across all countries; relative_to allocates a new Path each
+    # call, so resolve it once outside the loop.
+    ir_countries_rel = ir_countries_dir.relative_to(ir_game)
+
     # --- normal country setup ---
     for country in country_data:
         lines = [
-            f"# {country['tag']} -> {ir_countries_dir.relative_to(ir_game)}/{country['setup_dir']}/{country['setup_file']}",
+            f"# {country['tag']} -> {ir_countries_rel}/{country['setup_dir']}/{country['setup_file']}",
             f"color = {convert_color(country['color'])}",
             f"culture_definition = {country['culture']}",
             f"religion_definition = {country['religion']}",
@@ -261,28 +277,44 @@ def write_country_setup(country_data: list, override_data: list):
 def write_localisation_files(
     culture_data: list, religion_data: list, country_data: list
 ):
+    # Batch each record's lines into one extend call instead of appending
+    # entry by entry.
     culture_lines = [f"l_english:"]
     for culture_group in culture_data:
-        culture_lines.append(f'  {culture_group["tag"]}: "{culture_group["name"]}"')
-        culture_lines.append(
-            f'  {culture_group["tag"]}_desc: "{culture_group["name_desc"]}"'
+        culture_lines.extend(
+            (
+                f'  {culture_group["tag"]}: "{culture_group["name"]}"',
+                f'  {culture_group["tag"]}_desc: "{culture_group["name_desc"]}"',
+            )
+        )
+        culture_lines.extend(
+            f'  {culture["tag"]}: "{culture["name"]}"'
+            for culture in culture_group["cultures"]
         )
-        for culture in culture_group["cultures"]:
-            culture_lines.append(f'  {culture["tag"]}: "{culture["name"]}"')
 
-    religion_lines = [f"l_english:"]
-    religion_lines.append(f'  ir_religion_group: "Ir religion group"')
-    religion_lines.append(f'  ir_religion_group_ADJ: "Ir religion group"')
-    religion_lines.append(f'  ir_religion_group_desc: "Ir religion group"')
+    religion_lines = [
+        f"l_english:",
+        f'  ir_religion_group: "Ir religion group"',
+        f'  ir_religion_group_ADJ: "Ir religion group"',
+        f'  ir_religion_group_desc: "Ir religion group"',
+    ]
     for religion in religion_data:
-        religion_lines.append(f'  {religion["tag"]}: "{religion["name"]}"')
-        religion_lines.append(f'  {religion["tag"]}_ADJ: "{religion["name_adj"]}"')
-        religion_lines.append(f'  {religion["tag"]}_desc: "{religion["name_desc"]}"')
+        religion_lines.extend(
+            (
+                f'  {religion["tag"]}: "{religion["name"]}"',
+                f'  {religion["tag"]}_ADJ: "{religion["name_adj"]}"',
+                f'  {religion["tag"]}_desc: "{religion["name_desc"]}"',
+            )
+        )
 
     country_lines = [f"l_english:"]
     for country in country_data:
-        country_lines.append(f'  {country["tag"]}: "{country["name"]}"')
-        country_lines.append(f'  {country["tag"]}_ADJ: "{country["name_adj"]}"')
+        country_lines.extend(
+            (
+                f'  {country["tag"]}: "{country["name"]}"',
+                f'  {country["tag"]}_ADJ: "{country["name_adj"]}"',
+            )
+        )
 
     write_blocks(iu_localisation / "ir_cultures_l_english.yml", culture_lines)
     write_blocks(iu_localisation / "ir_religions_l_english.yml", religion_lines)
@@ -378,25 +410,26 @@ def write_blocks_with_comments(
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Collect every rendered piece and join once at the end instead of
+    # joining and writing per block.
+    parts: list[str] = []
+    for block in blocks:
+        if isinstance(block, tuple) and len(block) == 2:
+            tag, lines = block
+            parts.extend(render_block(tag, lines, level=0))
+        else:
+            # raw string block
+            s = str(block)
+            parts.append(s[:-1] if s.endswith("\n") else s)
+
     with out_path.open(mode, encoding=encoding) as f:
-        for block in blocks:
-            if isinstance(block, tuple) and len(block) == 2:
-                tag, lines = block
-                rendered_lines = render_block(tag, lines, level=0)
-                f.write("\n".join(rendered_lines) + "\n")
-            else:
-                # raw string block
-                s = str(block)
-                f.write(s)
-                if not s.endswith("\n"):
-                    f.write("\n")
+        f.write("\n".join(parts) + "\n" if parts else "")
 
     print_written("file", out_path)
     return out_path
 
 
 def write_10_countries(ten_countries_data, country_data, eu5_map_data):
-    country_map = {country["tag"]: country for country in country_data}
     blocks = []
     comment_tags = set()
 
@@ -409,7 +442,7 @@ def write_10_countries(ten_countries_data, country_data, eu5_map_data):
     for country in country_data:
         tag = country["tag"]
         country_name = country.get("name", tag)
-        government_type = government_map[country_map[tag]["government"]]
+        government_type = government_map[country["government"]]
 
         # --- start from base, preserve everything ---
         base = ten_countries_data.get(tag, {})